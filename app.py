@@ -1,6 +1,7 @@
 import sys
 import globals
 from skull_finder import SkullFinder
+from solver import Solver
 
 from PySide6.QtCore import QSize, Qt, QTimer
 from PySide6.QtGui import QPixmap, QFontDatabase, QFont
@@ -58,8 +59,8 @@ class GoalButton(QToolButton):
         self.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonIconOnly)
         self.skull_finder = skull_finder
         self.window = window
-        self.setFixedSize(QSize(448, 64))
-        self.setIconSize(QSize(448, 64))
+        self.setFixedSize(QSize(64 * skull_finder.col_size, 64))
+        self.setIconSize(QSize(64 * skull_finder.col_size, 64))
         self.setDisabled(True)
         self.setCheckable(False)
         self.setIcon(QPixmap("assets/goal.png"))
@@ -74,7 +75,11 @@ class GoalButton(QToolButton):
 
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, row_size: int = 7, col_size: int = 7):
+        # The controls row puts a title label on each side of the auto button in the middle column
+        if col_size < 3:
+            raise ValueError(f"Invalid col_size: {col_size}. The window needs at least 3 columns")
+
         super().__init__()
 
         self.setWindowTitle("Skull Solver")
@@ -87,15 +92,12 @@ class MainWindow(QMainWindow):
         self.layout.setContentsMargins(0, 0, 0, 0)
         self.setCentralWidget(central)
 
-        self.skull_finder = SkullFinder(row_size=7, col_size=7)
+        self.skull_finder = SkullFinder(row_size=row_size, col_size=col_size)
         self.skull_finder.fill_grid()
         self.selected_row = self.skull_finder.row_size
         self.selected_col = 0
 
-        self.auto_grid = []
-        for _ in range(self.skull_finder.row_size):
-            row = [{"safe": False, "flag": False} for _ in range(self.skull_finder.col_size)]
-            self.auto_grid.append(row)
+        self.solver = Solver(self.skull_finder)
 
         self.button_grid = []
         for row in range(0, self.skull_finder.row_size):
@@ -119,7 +121,10 @@ class MainWindow(QMainWindow):
         self.button_auto.setIcon(QPixmap("assets/auto.png"))
         self.button_auto.setIconSize(QSize(32, 32))
         self.button_auto.clicked.connect(self.toggle_auto)
-        self.layout.addWidget(self.button_auto, 8, 3)
+        # Controls and labels sit under the board, with the auto button in the middle column
+        controls_row = self.skull_finder.row_size + 1
+        middle_col = self.skull_finder.col_size // 2
+        self.layout.addWidget(self.button_auto, controls_row, middle_col)
 
         self.auto_timer = QTimer()
         self.auto_timer.setInterval(500)
@@ -127,9 +132,7 @@ class MainWindow(QMainWindow):
         self.auto_timer.timeout.connect(self.auto_solve)
 
         self.button_goal = GoalButton(skull_finder=self.skull_finder, window=self)
-        self.layout.addWidget(self.button_goal, 0, 0, 1, 7)
-
-        self.destinations = []
+        self.layout.addWidget(self.button_goal, 0, 0, 1, self.skull_finder.col_size)
 
         QFontDatabase.addApplicationFont("assets/vtRemingtonPortable.ttf")
         vt_remington = QFontDatabase.applicationFontFamilies(0)
@@ -150,10 +153,10 @@ class MainWindow(QMainWindow):
 
         self.label_title_skull.setStyleSheet("color: red;")
         self.label_title_solver.setStyleSheet("color: red;")
-        self.layout.addWidget(self.label_title_skull, 8, 0, 1, 3)
-        self.layout.addWidget(self.label_title_solver, 8, 4, 1, 3)
+        self.layout.addWidget(self.label_title_skull, controls_row, 0, 1, middle_col)
+        self.layout.addWidget(self.label_title_solver, controls_row, middle_col + 1, 1, self.skull_finder.col_size - middle_col - 1)
 
-        self.layout.addWidget(self.label_tutorial, 9, 0, 1, 7)
+        self.layout.addWidget(self.label_tutorial, controls_row + 1, 0, 1, self.skull_finder.col_size)
 
     def toggle_auto(self):
         if not self.option_auto:
@@ -257,45 +260,30 @@ class MainWindow(QMainWindow):
         self.auto_running = False
         self.button_auto.setChecked(False)
         self.button_auto.setDisabled(False)
-        self.skull_finder = SkullFinder(row_size=7, col_size=7)
+        self.skull_finder = SkullFinder(row_size=self.skull_finder.row_size, col_size=self.skull_finder.col_size)
         self.skull_finder.fill_grid()
         self.skull_finder.status = globals.PLAYING
         self.selected_row = self.skull_finder.row_size
         self.selected_col = 0
-        self.destinations = []
-
-        self.auto_grid = []
-        for _ in range(self.skull_finder.row_size):
-            row = [{"safe": False, "flag": False} for _ in range(self.skull_finder.col_size)]
-            self.auto_grid.append(row)
+        self.solver = Solver(self.skull_finder)
 
         # Replace the completed connected skull finder object with the new one for each button
         for row in range(0, self.skull_finder.row_size):
             for col in range(0, self.skull_finder.col_size):
                 self.button_grid[row][col].skull_finder = self.skull_finder
+        self.button_goal.skull_finder = self.skull_finder
 
         self.update_button_grid(self.selected_row, self.selected_col)
 
     def auto_solve(self):
         self.auto_running = True
-        self.destinations = self.analyze_board_simple()
-        # Later loops can enable earlier loops to find new destinations. Check again
-        if not self.destinations:
-            self.destinations = self.analyze_board_simple()
+        next_move = None
+        if self.skull_finder.status == globals.PLAYING and self.option_auto:
+            next_move = self.solver.next_move(self.selected_row, self.selected_col)
 
-        # Use complex analysis methods after simple analysis yields no results
-        if not self.destinations:
-            self.destinations = self.analyze_board_complex()
+        print("Destinations:", self.solver.destinations)
 
-        print("Destinations:", self.destinations)
-
-        explored_top_row = self.check_explored_top_row()
-        if explored_top_row:
-            print("Moving to goal")
-            self.button_goal.on_click()
-            self.destinations = []
-
-        if not self.destinations or self.skull_finder.status != globals.PLAYING or not self.option_auto:
+        if next_move is None:
             self.auto_running = False
             self.button_auto.setDisabled(False)
             self.button_auto.setChecked(False)
@@ -304,198 +292,13 @@ class MainWindow(QMainWindow):
             print("End of auto solve")
             return
 
-        self.destinations = self.sort_destinations()
-
-        # Check if unexplored with each move because cells with 0 will recursively explore adjacent cells with 0
-        next_destination = None
-        while self.destinations:
-            destination_to_check = self.destinations.pop(0)
-
-            # Assume no access to diagonal moves in Skull Finder. Diagonals are technically possible but not intended.
-            cardinal_neighbors = self.get_cardinal_neighbors(destination_to_check["row"], destination_to_check["col"])
-            explored_cardinal_neighbors = [cell for cell in cardinal_neighbors if self.skull_finder.grid_displayed_data[cell["row"]][cell["col"]] != globals.CELL_UNEXPLORED]
-            is_bottom_row = destination_to_check["row"] == self.skull_finder.row_size - 1
-
-            if (explored_cardinal_neighbors or is_bottom_row) and self.skull_finder.grid_displayed_data[destination_to_check["row"]][destination_to_check["col"]] == globals.CELL_UNEXPLORED:
-                next_destination = destination_to_check
-                break
-
-        if next_destination:
-            print("Moving to:", next_destination["row"], next_destination["col"])
-            self.button_grid[next_destination["row"]][next_destination["col"]].on_click()
-
-    def check_explored_top_row(self):
-        explored_top_row = []
-        for col in range(0, self.skull_finder.col_size):
-            if self.skull_finder.grid_displayed_data[globals.TOP_ROW][col] not in [globals.CELL_UNEXPLORED, globals.CELL_EXPLORED_SKULL]:
-                explored_top_row.append({"row": globals.TOP_ROW, "col": col})
-
-        return explored_top_row
-
-    def analyze_board_simple(self):
-        # Loop 1: The bottom row in Skull Finder is always safe. Mark as safe
-        for col in range(0, self.skull_finder.col_size):
-            self.auto_grid[self.skull_finder.row_size - 1][col]["safe"] = True
-
-        # Loop 2: Compare cell value with number of unsafe unexplored neighbors
-        # If the number of unexplored unsafe neighbors == the cell value, then flag all unexplored unsafe neighbors
-        for row in range(0, self.skull_finder.row_size):
-            for col in range(0, self.skull_finder.col_size):
-                if self.skull_finder.grid_displayed_data[row][col] not in range(1, 10):
-                    continue
-
-                neighbors = self.get_neighbors(row, col)
-                neighbors_unexplored = [cell for cell in neighbors if self.skull_finder.grid_displayed_data[cell["row"]][cell["col"]] == globals.CELL_UNEXPLORED]
-                neighbors_unexplored_unsafe = [cell for cell in neighbors_unexplored if not self.auto_grid[cell["row"]][cell["col"]]["safe"]]
-
-                if len(neighbors_unexplored_unsafe) == self.skull_finder.grid_displayed_data[row][col]:
-                    for neighbor in neighbors_unexplored_unsafe:
-                        self.auto_grid[neighbor["row"]][neighbor["col"]]["flag"] = True
-
-        # Loop 3: Compare cell value with number of flagged neighbors
-        # If the number of flagged neighbors == the cell value, then mark all non-flagged neighbors as safe.
-        for row in range(0, self.skull_finder.row_size):
-            for col in range(0, self.skull_finder.col_size):
-                if self.skull_finder.grid_displayed_data[row][col] not in range(1, 10):
-                    continue
-
-                neighbors = self.get_neighbors(row, col)
-                neighbors_flagged = [cell for cell in neighbors if self.auto_grid[cell["row"]][cell["col"]]["flag"]]
-                neighbors_non_flagged = [cell for cell in neighbors if not self.auto_grid[cell["row"]][cell["col"]]["flag"]]
-
-                if len(neighbors_flagged) == self.skull_finder.grid_displayed_data[row][col]:
-                    for neighbor in neighbors_non_flagged:
-                        self.auto_grid[neighbor["row"]][neighbor["col"]]["safe"] = True
-
-        # Final loop: Add all unexplored safe cells to the destinations list
-        destinations = []
-        for row in range(0, self.skull_finder.row_size):
-            for col in range(0, self.skull_finder.col_size):
-                if self.skull_finder.grid_displayed_data[row][col] == globals.CELL_UNEXPLORED and self.auto_grid[row][col]["safe"]:
-                    if self.auto_grid[row][col]["flag"]:
-                        raise Exception(f"Cell {row}, {col} is marked as both flagged and safe")
-
-                    destinations.append({"row": row, "col": col})
-
-        return destinations
-
-    def analyze_board_complex(self):
-        # Loop 4: Advanced comparison between two cardinal neighbors (no diagonals) with values 1-9.
-        for row_1 in range(0, self.skull_finder.row_size):
-            for col_1 in range(0, self.skull_finder.col_size):
-                if self.skull_finder.grid_displayed_data[row_1][col_1] not in range(1, 10):
-                    continue
-
-                cardinal_neighbors = self.get_cardinal_neighbors(row_1, col_1)
-                for neighbor in cardinal_neighbors:
-                    row_2 = neighbor["row"]
-                    col_2 = neighbor["col"]
-                    if self.skull_finder.grid_displayed_data[row_2][col_2] not in range(1, 10):
-                        continue
-
-                    neighbors_a = self.get_neighbors(row_1, col_1)
-                    neighbors_a_flagged = [cell for cell in neighbors_a if self.auto_grid[cell["row"]][cell["col"]]["flag"]]
-                    neighbors_a_unexplored = [cell for cell in neighbors_a if self.skull_finder.grid_displayed_data[cell["row"]][cell["col"]] == globals.CELL_UNEXPLORED]
-                    neighbors_a_unexplored_non_flagged = [cell for cell in neighbors_a_unexplored if not self.auto_grid[cell["row"]][cell["col"]]["flag"]]
-
-                    neighbors_b = self.get_neighbors(row_2, col_2)
-                    neighbors_b_flagged = [cell for cell in neighbors_b if self.auto_grid[cell["row"]][cell["col"]]["flag"]]
-                    neighbors_b_unexplored = [cell for cell in neighbors_b if self.skull_finder.grid_displayed_data[cell["row"]][cell["col"]] == globals.CELL_UNEXPLORED]
-                    neighbors_b_unexplored_non_flagged = [cell for cell in neighbors_b_unexplored if not self.auto_grid[cell["row"]][cell["col"]]["flag"]]
-
-                    modified_value_a = self.skull_finder.grid_displayed_data[row_1][col_1] - len(neighbors_a_flagged)
-                    modified_value_b = self.skull_finder.grid_displayed_data[row_2][col_2] - len(neighbors_b_flagged)
-
-                    neighbors_a_unexplored_non_flagged_exclusive = [cell for cell in neighbors_a_unexplored_non_flagged if cell not in neighbors_b_unexplored_non_flagged]
-                    neighbors_b_unexplored_non_flagged_exclusive = [cell for cell in neighbors_b_unexplored_non_flagged if cell not in neighbors_a_unexplored_non_flagged]
-
-                    if modified_value_a - modified_value_b == len(neighbors_a_unexplored_non_flagged_exclusive):
-                        for cell in neighbors_a_unexplored_non_flagged_exclusive:
-                            self.auto_grid[cell["row"]][cell["col"]]["flag"] = True
-                        for cell in neighbors_b_unexplored_non_flagged_exclusive:
-                            self.auto_grid[cell["row"]][cell["col"]]["safe"] = True
-
-        # Final loop: Add all unexplored safe cells to the destinations list
-        destinations = []
-        for row in range(0, self.skull_finder.row_size):
-            for col in range(0, self.skull_finder.col_size):
-                if self.skull_finder.grid_displayed_data[row][col] == globals.CELL_UNEXPLORED and self.auto_grid[row][col]["safe"]:
-                    if self.auto_grid[row][col]["flag"]:
-                        raise Exception(f"Cell {row}, {col} is marked as both flagged and safe")
-
-                    destinations.append({"row": row, "col": col})
-
-        return destinations
-
-    def get_neighbors(self, row: int, col: int):
-        neighbors = []
-        for x in range(-1, 2):
-            if not self.skull_finder.valid_row(row + x):
-                continue
-
-            for y in range(-1, 2):
-                if not self.skull_finder.valid_col(col + y):
-                    continue
-
-                if x == 0 and y == 0:
-                    continue
-
-                neighbors.append({"row": row + x, "col": col + y})
-
-        return neighbors
-
-    def get_cardinal_neighbors(self, row: int, col: int):
-        neighbors = []
-        for x in range(-1, 2):
-            if not self.skull_finder.valid_row(row + x):
-                continue
-
-            for y in range(-1, 2):
-                if not self.skull_finder.valid_col(col + y):
-                    continue
-
-                if abs(x) == abs(y):
-                    continue
-
-                neighbors.append({"row": row + x, "col": col + y})
-
-        return neighbors
-
-    def sort_destinations(self):
-        # Sort destinations by distance from the selected cell + distance from the goal row
-        for destination in self.destinations:
-            heuristic = destination["row"]
-            distance = abs(self.selected_row - destination["row"]) + abs(self.selected_col - destination["col"])
-            destination["priority"] = heuristic + distance
-
-        sorted_destinations = sorted(self.destinations, key=lambda x: x["priority"])
-        return sorted_destinations
-
-    def pathfind_to_cell(self, target_row: int, target_col: int):
-        # Create a graph of currently explored cells and the target cell
-        graph = {}
-        for row in range(0, self.skull_finder.row_size):
-            for col in range(0, self.skull_finder.col_size):
-                if self.skull_finder.grid_displayed_data[row][col] != globals.CELL_UNEXPLORED:
-                    graph[(row, col)] = []
-
-        # Connect cardinal neighbors
-        for node in graph:
-            row = node[0]
-            col = node[1]
-            neighbors = self.get_cardinal_neighbors(row, col)
-            for neighbor in neighbors:
-                graph[node].append((neighbor["row"], neighbor["col"]))
-
-        # Pathfind to the target cell using A* algorithm
-        start_node = (self.selected_row, self.selected_col)
-        end_node = (target_row, target_col)
-        path = self.a_star(graph, start_node, end_node)
-        return path
-
-    def a_star(self, graph, start, end):
-        # TODO
-        pass
+        row, col = next_move
+        if row == globals.ABOVE_TOP_ROW:
+            print("Moving to goal")
+            self.button_goal.on_click()
+        else:
+            print("Moving to:", row, col)
+            self.button_grid[row][col].on_click()
 
 
 if __name__ == "__main__":
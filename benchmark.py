@@ -0,0 +1,215 @@
+"""benchmark.py
+
+Win rate and latency regression harness for solver strategies.
+
+Every strategy plays the same seeded boards, so results are directly comparable. Reported per strategy:
+- Win rate with a 95% Wilson confidence interval
+- Mean and p99 decision latency (CPU time spent in Solver.next_move)
+- Mean moves per game
+
+Gates (exit status 1 when any selected strategy fails one):
+- --min-win-rate: The lower bound of the win rate's 95% interval must reach this value
+- --max-p99-ms: p99 decision latency must not exceed this value
+- --baseline: Compare against a report saved earlier with --save-baseline from the same board settings.
+  Both runs play the same seeded boards and the solver is deterministic, so boards are compared one by one.
+  A strategy regresses when it loses more of the baseline's won boards than it gains,
+  or when its p99 latency grows by more than --latency-tolerance
+
+Latency is the CPU time of the worker's own thread, so time spent waiting for a core while other workers or
+processes run is not counted. Latency gates hold with the default pool of one worker per core.
+
+Example:
+`python benchmark.py --games 2000 --save-baseline baseline.json`
+`python benchmark.py --games 2000 --baseline baseline.json`
+"""
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import time
+
+import globals
+from skull_finder import SkullFinder, SparseSkullFinder
+from solver import Solver
+
+STRATEGIES = {
+    "simple": {"analysis": "simple"},
+    "pairwise": {"analysis": "pairwise"},
+    "deduction": {"analysis": "deduction"},
+    "deduction-nearest": {"analysis": "deduction", "order": "nearest"},
+    "deduction-guess": {"analysis": "deduction", "guess": True},
+}
+
+Z_95 = 1.96
+
+
+def play_game(task: tuple):
+    strategy, seed, row_size, col_size, skull_count, sparse = task
+
+    # Seed before filling so every strategy sees the same board for the same seed
+    random.seed(seed)
+    if sparse:
+        skull_finder = SparseSkullFinder(row_size=row_size, col_size=col_size, skull_count=skull_count)
+    else:
+        skull_finder = SkullFinder(row_size=row_size, col_size=col_size, skull_count=skull_count)
+    skull_finder.fill_grid()
+    solver = Solver(skull_finder, **STRATEGIES[strategy])
+
+    selected_row = skull_finder.row_size
+    selected_col = 0
+    latencies = []
+    moves = 0
+    while skull_finder.status == globals.PLAYING:
+        start = time.thread_time()
+        next_move = solver.next_move(selected_row, selected_col)
+        latencies.append(time.thread_time() - start)
+
+        if next_move is None:
+            break
+
+        selected_row, selected_col = next_move
+        skull_finder.explore_cell(selected_row, selected_col)
+        moves += 1
+
+    return strategy, seed, skull_finder.status == globals.WIN, moves, latencies
+
+
+def wilson_interval(wins: int, games: int):
+    if games == 0:
+        return 0.0, 0.0
+
+    rate = wins / games
+    denominator = 1 + Z_95 ** 2 / games
+    center = (rate + Z_95 ** 2 / (2 * games)) / denominator
+    margin = Z_95 * math.sqrt(rate * (1 - rate) / games + Z_95 ** 2 / (4 * games ** 2)) / denominator
+    return center - margin, center + margin
+
+
+def percentile(values: list, percent: int):
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+
+    return statistics.quantiles(values, n=100, method="inclusive")[percent - 1]
+
+
+def run(strategies: list, games: int, seed: int, row_size: int, col_size: int, workers: int, skull_count: int = None, sparse: bool = False):
+    results = {strategy: {"wins": 0, "games": 0, "won_seeds": [], "moves": [], "latencies": []} for strategy in strategies}
+    tasks = [(strategy, game_seed, row_size, col_size, skull_count, sparse) for strategy in strategies for game_seed in range(seed, seed + games)]
+
+    with multiprocessing.Pool(workers) as pool:
+        for strategy, game_seed, won, moves, latencies in pool.imap_unordered(play_game, tasks, chunksize=max(1, len(tasks) // (workers * 8))):
+            result = results[strategy]
+            result["games"] += 1
+            result["wins"] += won
+            if won:
+                result["won_seeds"].append(game_seed)
+            result["moves"].append(moves)
+            result["latencies"].extend(latencies)
+
+    report = {}
+    for strategy, result in results.items():
+        low, high = wilson_interval(result["wins"], result["games"])
+        report[strategy] = {
+            "win_rate": result["wins"] / result["games"] if result["games"] else 0.0,
+            "win_rate_low": low,
+            "win_rate_high": high,
+            "mean_ms": statistics.fmean(result["latencies"]) * 1000 if result["latencies"] else 0.0,
+            "p99_ms": percentile(result["latencies"], 99) * 1000,
+            "mean_moves": statistics.fmean(result["moves"]) if result["moves"] else 0.0,
+            "won_seeds": sorted(result["won_seeds"]),
+        }
+
+    return report
+
+
+def check_thresholds(report: dict, min_win_rate: float = None, max_p99_ms: float = None):
+    failures = []
+    for strategy, metrics in report.items():
+        if min_win_rate is not None and metrics["win_rate_low"] < min_win_rate:
+            failures.append(f"{strategy}: win rate lower bound {metrics['win_rate_low']:.2%} is below {min_win_rate:.2%}")
+        if max_p99_ms is not None and metrics["p99_ms"] > max_p99_ms:
+            failures.append(f"{strategy}: p99 latency {metrics['p99_ms']:.3f} ms is above {max_p99_ms:.3f} ms")
+
+    return failures
+
+
+def check_baseline(report: dict, baseline: dict, latency_tolerance: float):
+    failures = []
+    for strategy, metrics in report.items():
+        if strategy not in baseline:
+            continue
+
+        # Only boards with different outcomes matter. Fail on any net loss of games
+        baseline_metrics = baseline[strategy]
+        won_seeds = set(metrics["won_seeds"])
+        baseline_won_seeds = set(baseline_metrics["won_seeds"])
+        lost = len(baseline_won_seeds - won_seeds)
+        gained = len(won_seeds - baseline_won_seeds)
+        if lost > gained:
+            failures.append(f"{strategy}: lost {lost} boards the baseline won and won {gained} it lost, a net loss of {lost - gained} games")
+
+        max_p99_ms = baseline_metrics["p99_ms"] * (1 + latency_tolerance)
+        if metrics["p99_ms"] > max_p99_ms:
+            failures.append(f"{strategy}: p99 latency {metrics['p99_ms']:.3f} ms regressed from {baseline_metrics['p99_ms']:.3f} ms")
+
+    return failures
+
+
+def print_report(report: dict, games: int):
+    print(f"{'Strategy':<20} {'Win rate':>9} {'95% CI':>17} {'Mean ms':>9} {'p99 ms':>9} {'Moves':>7}")
+    for strategy, metrics in report.items():
+        interval = f"{metrics['win_rate_low']:.2%}-{metrics['win_rate_high']:.2%}"
+        print(f"{strategy:<20} {metrics['win_rate']:>9.2%} {interval:>17} {metrics['mean_ms']:>9.3f} {metrics['p99_ms']:>9.3f} {metrics['mean_moves']:>7.2f}")
+    print(f"{games} games per strategy")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare solver strategies on identical seeded boards.")
+    parser.add_argument("--strategies", nargs="+", choices=list(STRATEGIES), default=list(STRATEGIES))
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0, help="First board seed. Boards use seeds seed to seed + games - 1")
+    parser.add_argument("--rows", type=int, default=7)
+    parser.add_argument("--cols", type=int, default=7)
+    parser.add_argument("--density", type=float, help="Fraction of cells holding a skull. Defaults to the classic (rows * cols / 8) + 1 skulls")
+    parser.add_argument("--sparse", action="store_true", help="Use SparseSkullFinder for huge, low-density boards")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--min-win-rate", type=float, help="Fail if any strategy's win rate lower bound is below this (0-1)")
+    parser.add_argument("--max-p99-ms", type=float, help="Fail if any strategy's p99 decision latency is above this")
+    parser.add_argument("--baseline", help="Fail if any strategy regressed from this saved report")
+    parser.add_argument("--latency-tolerance", type=float, default=0.25, help="Allowed p99 latency growth over the baseline (0.25 = 25%%)")
+    parser.add_argument("--save-baseline", help="Save this run's report as a baseline")
+    args = parser.parse_args()
+
+    # Baselines only compare like with like, so the board settings are saved alongside the report
+    settings = {"games": args.games, "seed": args.seed, "rows": args.rows, "cols": args.cols, "density": args.density, "sparse": args.sparse}
+
+    baseline_report = None
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline_data = json.load(baseline_file)
+        if baseline_data["settings"] != settings:
+            sys.exit(f"Baseline settings {baseline_data['settings']} do not match this run's settings {settings}")
+        baseline_report = baseline_data["report"]
+
+    board_skull_count = None if args.density is None else int(args.rows * args.cols * args.density)
+    benchmark_report = run(args.strategies, args.games, args.seed, args.rows, args.cols, args.workers, board_skull_count, args.sparse)
+    print_report(benchmark_report, args.games)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as baseline_file:
+            json.dump({"settings": settings, "report": benchmark_report}, baseline_file, indent=4)
+
+    threshold_failures = check_thresholds(benchmark_report, args.min_win_rate, args.max_p99_ms)
+    if baseline_report is not None:
+        threshold_failures += check_baseline(benchmark_report, baseline_report, args.latency_tolerance)
+    for failure in threshold_failures:
+        print(f"FAIL {failure}")
+
+    if threshold_failures:
+        sys.exit(1)
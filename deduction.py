@@ -0,0 +1,278 @@
+"""deduction.py
+
+Constraint deduction for the auto solver.
+
+Every explored number is a constraint: its unknown neighbors hold exactly (value - flagged neighbors) skulls.
+Unknown cells that share a constraint are grouped into components and given a bit each, so a constraint is
+stored as a (mask, count) pair. Each component is solved with:
+- Trivial rules: a count of 0 means every cell is safe, a count equal to the cell count means every cell is a skull
+- Subset reduction across every pair of constraints sharing a cell, in both directions
+- Gaussian elimination over the constraint matrix when subset reduction finds nothing, using integer rows that store
+  only their nonzero coefficients. Components above MAX_ELIMINATION_CELLS skip this step
+"""
+import math
+import globals
+from skull_finder import DenseMarks, DisplayedView, NeighborLookup, SparseMarks
+
+
+def deduce(displayed: DisplayedView, numbered: list, neighbors: NeighborLookup, auto_safe: DenseMarks | SparseMarks, auto_flag: DenseMarks | SparseMarks):
+    # Mark every cell the frontier constraints prove safe or flagged. Returns the number of newly marked cells
+    marked = 0
+    while True:
+        found = 0
+        for cells, constraints in build_components(displayed, numbered, neighbors, auto_safe, auto_flag):
+            safe, skull = solve_component(constraints, len(cells))
+            for bit, cell in enumerate(cells):
+                if safe >> bit & 1:
+                    auto_safe[cell] = 1
+                    found += 1
+                elif skull >> bit & 1:
+                    auto_flag[cell] = 1
+                    found += 1
+
+        # Newly marked cells shrink neighboring constraints. Rebuild and check again
+        if not found:
+            return marked
+        marked += found
+
+
+def frontier_constraints(displayed: DisplayedView, numbered: list, neighbors: NeighborLookup, auto_safe: DenseMarks | SparseMarks, auto_flag: DenseMarks | SparseMarks):
+    # Collect one constraint per explored number, keeping only unexplored cells not already marked safe or flagged.
+    # numbered holds (index, value) for every explored cell showing 1-9
+    constraints = []
+    for index, value in numbered:
+        unknown = []
+        count = value
+        for cell in neighbors[index]:
+            if auto_flag[cell] or displayed[cell] == globals.CELL_EXPLORED_SKULL:
+                count -= 1
+            elif displayed[cell] == globals.CELL_UNEXPLORED and not auto_safe[cell]:
+                unknown.append(cell)
+
+        if unknown:
+            constraints.append((unknown, count))
+
+    return constraints
+
+
+def build_components(displayed: DisplayedView, numbered: list, neighbors: NeighborLookup, auto_safe: DenseMarks | SparseMarks, auto_flag: DenseMarks | SparseMarks):
+    constraints = frontier_constraints(displayed, numbered, neighbors, auto_safe, auto_flag)
+    parent = {}
+    for unknown, count in constraints:
+        for cell in unknown:
+            parent.setdefault(cell, cell)
+            union(parent, unknown[0], cell)
+
+    # Split the frontier into independent components. Each cell gets a bit within its component
+    components = {}
+    for cell in parent:
+        components.setdefault(find(parent, cell), []).append(cell)
+
+    bits = {}
+    for cells in components.values():
+        for bit, cell in enumerate(cells):
+            bits[cell] = bit
+
+    component_constraints = {root: {} for root in components}
+    for unknown, count in constraints:
+        mask = 0
+        for cell in unknown:
+            mask |= 1 << bits[cell]
+        component_constraints[find(parent, unknown[0])][mask] = count
+
+    return [(components[root], component_constraints[root]) for root in components]
+
+
+def find(parent: dict, cell: int):
+    while parent[cell] != cell:
+        parent[cell] = parent[parent[cell]]
+        cell = parent[cell]
+    return cell
+
+
+def union(parent: dict, cell_a: int, cell_b: int):
+    root_a = find(parent, cell_a)
+    root_b = find(parent, cell_b)
+    if root_a != root_b:
+        parent[root_b] = root_a
+
+
+def solve_component(constraints: dict, cell_count: int):
+    # Returns bitsets of the cells proven safe and proven skulls
+    safe = 0
+    skull = 0
+    while constraints:
+        new_safe, new_skull = reduce_subsets(constraints)
+
+        # Subset reduction only looks at pairs. Fall back to treating the whole component as a linear system.
+        # Elimination runs on the original constraints only; the derived ones are combinations of them
+        if not new_safe and not new_skull and cell_count <= globals.MAX_ELIMINATION_CELLS:
+            new_safe, new_skull = eliminate(constraints)
+
+        if not new_safe and not new_skull:
+            break
+
+        safe |= new_safe
+        skull |= new_skull
+        constraints = substitute(constraints, new_safe, new_skull)
+
+    return safe, skull
+
+
+def mask_bits(mask: int):
+    # Single-bit masks for every cell in a constraint
+    bits = []
+    while mask:
+        bit = mask & -mask
+        bits.append(bit)
+        mask ^= bit
+    return bits
+
+
+def overlapping_pairs(constraints: dict):
+    # Index constraints by cell so only pairs that share a cell are compared
+    constraints_by_bit = {}
+    for mask in constraints:
+        for bit in mask_bits(mask):
+            constraints_by_bit.setdefault(bit, []).append(mask)
+
+    pairs = set()
+    for masks in constraints_by_bit.values():
+        for mask_a in masks:
+            for mask_b in masks:
+                if mask_a != mask_b:
+                    pairs.add((mask_a, mask_b))
+
+    return pairs
+
+
+def reduce_subsets(constraints: dict):
+    # Works on a copy so derived constraints never reach the caller
+    constraints = dict(constraints)
+    safe = 0
+    skull = 0
+    while True:
+        for mask, count in constraints.items():
+            if count == 0:
+                safe |= mask
+            elif count == mask.bit_count():
+                skull |= mask
+
+        if safe or skull:
+            return safe, skull
+
+        derived = {}
+        for mask_a, mask_b in overlapping_pairs(constraints):
+            count_a = constraints[mask_a]
+            count_b = constraints[mask_b]
+            exclusive_a = mask_a & ~mask_b
+            exclusive_b = mask_b & ~mask_a
+
+            # A is inside B, so the rest of B holds the difference
+            if not exclusive_a and exclusive_b not in constraints:
+                derived[exclusive_b] = count_b - count_a
+
+            # A has so many more skulls than B that every cell only A touches must be a skull
+            # and every cell only B touches must be safe
+            if count_a - count_b == exclusive_a.bit_count():
+                skull |= exclusive_a
+                safe |= exclusive_b
+
+        if safe or skull or not derived or len(constraints) + len(derived) > globals.MAX_CONSTRAINTS:
+            return safe, skull
+
+        constraints.update(derived)
+
+
+def combine(coefficients: dict, total: int, pivot_coefficients: dict, pivot_total: int, pivot_bit: int):
+    # Integer row operation that clears pivot_bit from a row, then divides out the common factor to keep numbers small
+    factor = coefficients[pivot_bit]
+    pivot_factor = pivot_coefficients[pivot_bit]
+    combined = {bit: coefficient * pivot_factor for bit, coefficient in coefficients.items()}
+    for bit, coefficient in pivot_coefficients.items():
+        value = combined.get(bit, 0) - coefficient * factor
+        if value:
+            combined[bit] = value
+        else:
+            combined.pop(bit, None)
+    combined_total = total * pivot_factor - pivot_total * factor
+
+    divisor = math.gcd(combined_total, *combined.values())
+    if divisor > 1:
+        combined = {bit: coefficient // divisor for bit, coefficient in combined.items()}
+        combined_total //= divisor
+
+    return combined, combined_total
+
+
+def eliminate(constraints: dict):
+    # Gaussian elimination to reduced row echelon form with integer rows. Each row stores only its nonzero
+    # coefficients, keyed by the cell's single-bit mask, so rows along a frontier stay short
+    rows = []
+    for mask, count in constraints.items():
+        coefficients = {bit: 1 for bit in mask_bits(mask)}
+        total = count
+        for row in rows:
+            if row[0] in coefficients:
+                coefficients, total = combine(coefficients, total, row[1], row[2], row[0])
+
+        if not coefficients:
+            continue
+
+        # Clear the new pivot from earlier rows so every pivot appears in exactly one row
+        pivot_bit = min(coefficients)
+        for row in rows:
+            if pivot_bit in row[1]:
+                row[1], row[2] = combine(row[1], row[2], coefficients, total, pivot_bit)
+
+        rows.append([pivot_bit, coefficients, total])
+
+    # Every cell is 0 or 1, so a row's total is bounded by its negative and positive coefficients.
+    # A total sitting on either bound forces every cell in the row
+    safe = 0
+    skull = 0
+    for _, coefficients, total in rows:
+        positive = 0
+        negative = 0
+        maximum = 0
+        minimum = 0
+        for bit, coefficient in coefficients.items():
+            if coefficient > 0:
+                positive |= bit
+                maximum += coefficient
+            else:
+                negative |= bit
+                minimum += coefficient
+
+        if total == maximum:
+            skull |= positive
+            safe |= negative
+        elif total == minimum:
+            safe |= positive
+            skull |= negative
+
+    return safe, skull
+
+
+def substitute(constraints: dict, safe: int, skull: int):
+    # Remove solved cells from every constraint, subtracting any skulls from the count
+    solved = safe | skull
+    remaining = {}
+    for mask, count in constraints.items():
+        count -= (mask & skull).bit_count()
+        mask &= ~solved
+        if mask:
+            remaining[mask] = count
+
+    return remaining
+
+
+def frontier_densities(displayed: DisplayedView, numbered: list, neighbors: NeighborLookup, auto_safe: DenseMarks | SparseMarks, auto_flag: DenseMarks | SparseMarks):
+    # Rough skull probability of each frontier cell for guessing: the highest local density of the constraints touching it
+    densities = {}
+    for unknown, count in frontier_constraints(displayed, numbered, neighbors, auto_safe, auto_flag):
+        local_density = count / len(unknown)
+        for cell in unknown:
+            densities[cell] = max(densities.get(cell, 0.0), local_density)
+
+    return densities
@@ -10,3 +10,7 @@ ABOVE_TOP_ROW = -1
 TOP_ROW = 0
 OFFSET_SAFE_ROW = 1
 MAX_ITERATIONS = 1000
+ITERATIONS_PER_SKULL = 100
+MAX_CONSTRAINTS = 1000
+MAX_ELIMINATION_CELLS = 500
+TILE_SIZE = 64
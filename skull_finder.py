@@ -12,18 +12,113 @@ Classic Defaults:
 
 Grindworks Defaults:
 - TODO
+
+Sparse Mode (SparseSkullFinder):
+- For huge, low-density boards. Pass skull_count to set the density
+- Skull positions are kept in a set of flat indices with a skull count per row
+- The displayed grid is split into TILE_SIZE x TILE_SIZE tiles, created only once a cell inside them is explored
+- Memory grows with the skull count and the explored area instead of the board size
 """
+import array
 import random
 import globals
 
 
+def cell_neighbors(row_size: int, col_size: int, index: int, cardinal: bool = False):
+    # Neighbor indices of one cell, indexed by row * col_size + col
+    row, col = divmod(index, col_size)
+    neighbors = []
+    for x in range(-1, 2):
+        if row + x < 0 or row + x >= row_size:
+            continue
+
+        for y in range(-1, 2):
+            if col + y < 0 or col + y >= col_size:
+                continue
+
+            if x == 0 and y == 0:
+                continue
+
+            if cardinal and abs(x) == abs(y):
+                continue
+
+            neighbors.append((row + x) * col_size + col + y)
+
+    return tuple(neighbors)
+
+
+class NeighborLookup:
+    # Neighbors indexed like a table, but computed on each lookup so nothing is stored per cell
+    __slots__ = ("row_size", "col_size", "cardinal")
+
+    def __init__(self, row_size: int, col_size: int, cardinal: bool = False):
+        self.row_size = row_size
+        self.col_size = col_size
+        self.cardinal = cardinal
+
+    def __getitem__(self, index: int):
+        return cell_neighbors(self.row_size, self.col_size, index, self.cardinal)
+
+
+class DisplayedView:
+    # Read-only flat view of the displayed grid, indexed by row * col_size + col. Reads go straight to the board,
+    # so the view never goes stale and nothing is copied
+    __slots__ = ("get_displayed", "col_size", "cell_count")
+
+    def __init__(self, skull_finder):
+        self.get_displayed = skull_finder.get_displayed
+        self.col_size = skull_finder.col_size
+        self.cell_count = skull_finder.row_size * skull_finder.col_size
+
+    def __getitem__(self, index: int):
+        row, col = divmod(index, self.col_size)
+        return self.get_displayed(row, col)
+
+    def __len__(self):
+        return self.cell_count
+
+
+class DenseMarks(bytearray):
+    # Solver marks (safe or flagged) with one byte per cell, indexed by row * col_size + col
+    def marked_count(self):
+        return self.count(1)
+
+
+class SparseMarks:
+    # Same interface as DenseMarks for sparse boards. Only marked cells are stored
+    __slots__ = ("cells",)
+
+    def __init__(self, cell_count: int):
+        self.cells = set()
+
+    def __getitem__(self, index: int):
+        return 1 if index in self.cells else 0
+
+    def __setitem__(self, index: int, value: int):
+        if value:
+            self.cells.add(index)
+        else:
+            self.cells.discard(index)
+
+    def marked_count(self):
+        return len(self.cells)
+
+
 class SkullFinder:
-    def __init__(self, row_size: int = 7, col_size: int = 7):
+    sparse: bool = False
+
+    def __init__(self, row_size: int = 7, col_size: int = 7, skull_count: int = None):
         self.row_size: int = row_size
         self.col_size: int = col_size
-        self.skull_count: int = (row_size * col_size) // 8 + 1
+        self.skull_count: int = (row_size * col_size) // 8 + 1 if skull_count is None else skull_count
         self.status: int = globals.PLAYING
 
+        # Flat indices of explored cells in the order they were revealed, so the solver only reads new cells each move
+        self.revealed_cells = array.array("q")
+
+        self.create_grids()
+
+    def create_grids(self):
         self.grid_skull_data = []
         for _ in range(self.row_size):
             self.grid_skull_data.append([False] * self.col_size)
@@ -34,7 +129,7 @@ class SkullFinder:
 
     def fill_grid(self):
         placed_skulls = 0
-        max_iterations = globals.MAX_ITERATIONS
+        max_iterations = max(globals.MAX_ITERATIONS, self.skull_count * globals.ITERATIONS_PER_SKULL)
 
         if self.skull_count < 0:
             raise ValueError("Skull count cannot be negative.")
@@ -60,40 +155,43 @@ class SkullFinder:
             self.win()
             return
 
-        if self.grid_displayed_data[row][col] != globals.CELL_UNEXPLORED:
+        if self.get_displayed(row, col) != globals.CELL_UNEXPLORED:
             return
 
         if self.is_skull(row, col):
-            self.grid_displayed_data[row][col] = globals.CELL_EXPLORED_SKULL
+            self.set_displayed(row, col, globals.CELL_EXPLORED_SKULL)
 
             if not game_over:
                 self.lose()
-        else:
-            self.grid_displayed_data[row][col] = self.sum_neighboring_skulls(row, col)
+            return
 
-            # Reveal all neighboring cells if the current cell is blank
-            if self.grid_displayed_data[row][col] == globals.CELL_EXPLORED_BLANK:
-                for x in range(-1, 2):
-                    if not self.valid_row(row + x):
-                        continue
+        value = self.sum_neighboring_skulls(row, col)
+        self.set_displayed(row, col, value)
 
-                    for y in range(-1, 2):
-                        if not self.valid_col(col + y):
-                            continue
+        # Reveal all neighboring cells if the current cell is blank. Uses a stack of flat indices instead of recursion
+        # so large blank regions cannot hit the recursion limit. Cells are revealed as they are found, so each one is
+        # visited once and only blank cells wait on the stack. Neighbors of a blank cell are never skulls
+        if value != globals.CELL_EXPLORED_BLANK:
+            return
+
+        blank_cells = array.array("q", [self.get_index(row, col)])
+        while blank_cells:
+            row, col = divmod(blank_cells.pop(), self.col_size)
+            for neighbor_row in range(max(row - 1, 0), min(row + 2, self.row_size)):
+                for neighbor_col in range(max(col - 1, 0), min(col + 2, self.col_size)):
+                    if self.get_displayed(neighbor_row, neighbor_col) != globals.CELL_UNEXPLORED:
+                        continue
 
-                        self.explore_cell(row + x, col + y, game_over=game_over)
+                    value = self.sum_neighboring_skulls(neighbor_row, neighbor_col)
+                    self.set_displayed(neighbor_row, neighbor_col, value)
+                    if value == globals.CELL_EXPLORED_BLANK:
+                        blank_cells.append(self.get_index(neighbor_row, neighbor_col))
 
     def sum_neighboring_skulls(self, row: int, col: int):
         count = 0
-        for x in range(-1, 2):
-            if not self.valid_row(row + x):
-                continue
-
-            for y in range(-1, 2):
-                if not self.valid_col(col + y):
-                    continue
-
-                if self.is_skull(row + x, col + y):
+        for neighbor_row in range(max(row - 1, 0), min(row + 2, self.row_size)):
+            for neighbor_col in range(max(col - 1, 0), min(col + 2, self.col_size)):
+                if self.grid_skull_data[neighbor_row][neighbor_col]:
                     count += 1
 
         return count
@@ -108,7 +206,7 @@ class SkullFinder:
                 if not self.valid_col(col + y):
                     continue
 
-                if self.grid_displayed_data[row + x][col + y] == globals.CELL_UNEXPLORED:
+                if self.get_displayed(row + x, col + y) == globals.CELL_UNEXPLORED:
                     count += 1
 
         return count
@@ -131,6 +229,12 @@ class SkullFinder:
             return False
         return True
 
+    def get_index(self, row: int, col: int):
+        return row * self.col_size + col
+
+    def flat_displayed_data(self):
+        return DisplayedView(self)
+
     def print_skull_grid(self):
         for row in self.grid_skull_data:
             print(row)
@@ -156,6 +260,77 @@ class SkullFinder:
     def place_skull(self, row: int, col: int):
         self.grid_skull_data[row][col] = True
 
+    def get_displayed(self, row: int, col: int):
+        return self.grid_displayed_data[row][col]
+
+    def set_displayed(self, row: int, col: int, value: int):
+        if self.grid_displayed_data[row][col] == globals.CELL_UNEXPLORED:
+            self.revealed_cells.append(self.get_index(row, col))
+        self.grid_displayed_data[row][col] = value
+
+
+class SparseSkullFinder(SkullFinder):
+    sparse: bool = True
+
+    def create_grids(self):
+        self.skull_positions = set()
+        self.row_skull_counts = {}
+        self.tiles = {}
+
+    def sum_neighboring_skulls(self, row: int, col: int):
+        count = 0
+        for neighbor_row in range(max(row - 1, 0), min(row + 2, self.row_size)):
+            row_start = neighbor_row * self.col_size
+            for neighbor_col in range(max(col - 1, 0), min(col + 2, self.col_size)):
+                if row_start + neighbor_col in self.skull_positions:
+                    count += 1
+
+        return count
+
+    def sum_row_skulls(self, row: int):
+        return self.row_skull_counts.get(row, 0)
+
+    def print_skull_grid(self):
+        print(sorted(divmod(index, self.col_size) for index in self.skull_positions))
+
+    def print_displayed_grid(self):
+        for tile_row, tile_col in sorted(self.tiles):
+            print(f"Tile at row {tile_row * globals.TILE_SIZE}, col {tile_col * globals.TILE_SIZE}")
+            tile = self.tiles[(tile_row, tile_col)]
+            for offset in range(0, len(tile), globals.TILE_SIZE):
+                print(tile[offset:offset + globals.TILE_SIZE].tolist())
+
+    def reveal_all(self):
+        # Exploring every cell of a huge board is not practical. Reveal the skulls only
+        for index in list(self.skull_positions):
+            self.explore_cell(*divmod(index, self.col_size), game_over=True)
+
+    def is_skull(self, row: int, col: int):
+        return row * self.col_size + col in self.skull_positions
+
+    def place_skull(self, row: int, col: int):
+        self.skull_positions.add(row * self.col_size + col)
+        self.row_skull_counts[row] = self.row_skull_counts.get(row, 0) + 1
+
+    def get_displayed(self, row: int, col: int):
+        tile = self.tiles.get((row // globals.TILE_SIZE, col // globals.TILE_SIZE))
+        if tile is None:
+            return globals.CELL_UNEXPLORED
+
+        return tile[(row % globals.TILE_SIZE) * globals.TILE_SIZE + col % globals.TILE_SIZE]
+
+    def set_displayed(self, row: int, col: int, value: int):
+        key = (row // globals.TILE_SIZE, col // globals.TILE_SIZE)
+        tile = self.tiles.get(key)
+        if tile is None:
+            tile = array.array("b", [globals.CELL_UNEXPLORED]) * (globals.TILE_SIZE * globals.TILE_SIZE)
+            self.tiles[key] = tile
+
+        offset = (row % globals.TILE_SIZE) * globals.TILE_SIZE + col % globals.TILE_SIZE
+        if tile[offset] == globals.CELL_UNEXPLORED:
+            self.revealed_cells.append(self.get_index(row, col))
+        tile[offset] = value
+
 
 if __name__ == "__main__":
     skull_finder = SkullFinder()
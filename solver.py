@@ -0,0 +1,278 @@
+"""solver.py
+
+Auto solver for Skull Finder, independent of the GUI.
+
+Strategy options:
+- analysis: How far to go once the simple loops find nothing
+  - "simple": Loops 1-3 only
+  - "pairwise": Compare cardinal neighbor pairs in one direction
+  - "deduction": Solve all frontier constraints together (see deduction.py)
+- guess: When no reachable cell is proven safe, move to the reachable cell least likely to hold a skull
+- order: How destinations are sorted
+  - "goal": Distance from the selected cell + distance from the goal row
+  - "nearest": Distance from the selected cell only
+
+The solver reads newly revealed cells each move and keeps the frontier (explored numbers with unresolved neighbors)
+between moves, so each move costs time in proportion to the frontier instead of the board size. Boards from
+SparseSkullFinder also keep safe and flagged cells in sets.
+"""
+import globals
+from skull_finder import SkullFinder, DenseMarks, DisplayedView, NeighborLookup, SparseMarks
+from deduction import deduce, frontier_densities
+
+ANALYSIS_OPTIONS = ("simple", "pairwise", "deduction")
+ORDER_OPTIONS = ("goal", "nearest")
+
+
+class Solver:
+    def __init__(self, skull_finder: SkullFinder, analysis: str = "deduction", guess: bool = False, order: str = "goal"):
+        if analysis not in ANALYSIS_OPTIONS:
+            raise ValueError(f"Invalid analysis: {analysis}")
+        if order not in ORDER_OPTIONS:
+            raise ValueError(f"Invalid order: {order}")
+
+        self.skull_finder = skull_finder
+        self.analysis = analysis
+        self.guess = guess
+        self.order = order
+        self.selected_row = skull_finder.row_size
+        self.selected_col = 0
+        self.destinations = []
+
+        # Safe and flagged cells are indexed by row * col_size + col. Byte arrays on dense boards, sets on sparse boards
+        marks = SparseMarks if skull_finder.sparse else DenseMarks
+        cell_count = skull_finder.row_size * skull_finder.col_size
+        self.auto_safe = marks(cell_count)
+        self.auto_flag = marks(cell_count)
+
+        # Kept up to date from skull_finder.revealed_cells by update_revealed
+        self.revealed_count = 0
+        self.frontier = {}
+        self.reached_top_row = False
+        self.explored_bottom_count = 0
+        self.explored_skulls = []
+
+        # Neighbors are computed from the row and column on each lookup instead of being stored per cell
+        self.neighbors = NeighborLookup(skull_finder.row_size, skull_finder.col_size)
+        self.cardinal_neighbors = NeighborLookup(skull_finder.row_size, skull_finder.col_size, cardinal=True)
+
+    def next_move(self, selected_row: int, selected_col: int):
+        # Returns the (row, col) to explore next, (ABOVE_TOP_ROW, -1) for the goal, or None when there is no move
+        self.selected_row = selected_row
+        self.selected_col = selected_col
+
+        # A live view of the board, shared by every loop this move
+        displayed = self.skull_finder.flat_displayed_data()
+        self.update_revealed(displayed)
+
+        # Safe cells behind flags or only reachable diagonally cannot be explored yet, so they do not count as results
+        self.destinations = self.reachable_destinations(self.analyze_board_simple(displayed), displayed)
+        # Later loops can enable earlier loops to find new destinations. Check again
+        if not self.destinations:
+            self.destinations = self.reachable_destinations(self.analyze_board_simple(displayed), displayed)
+
+        # Use complex analysis methods after simple analysis yields no reachable results
+        if not self.destinations and self.analysis != "simple":
+            self.destinations = self.reachable_destinations(self.analyze_board_complex(displayed), displayed)
+
+        if self.reached_top_row:
+            self.destinations = []
+            return globals.ABOVE_TOP_ROW, -1
+
+        self.destinations = self.sort_destinations()
+
+        if self.destinations:
+            return divmod(self.destinations.pop(0), self.skull_finder.col_size)
+
+        # Every loop, including complex analysis, found no reachable safe cell. Only now is guessing worth the risk
+        if self.guess:
+            return self.pick_guess(displayed)
+
+        return None
+
+    def reachable_destinations(self, destinations: list, displayed: DisplayedView):
+        return [destination for destination in destinations if self.is_reachable(destination, displayed)]
+
+    def is_reachable(self, index: int, displayed: DisplayedView):
+        # Assume no access to diagonal moves in Skull Finder. Diagonals are technically possible but not intended.
+        if index // self.skull_finder.col_size == self.skull_finder.row_size - 1:
+            return True
+
+        return any(displayed[cell] != globals.CELL_UNEXPLORED for cell in self.cardinal_neighbors[index])
+
+    def update_revealed(self, displayed: DisplayedView):
+        # Read the cells revealed since the last move instead of rescanning the board
+        bottom_row_start = self.skull_finder.get_index(self.skull_finder.row_size - 1, 0)
+        revealed_cells = self.skull_finder.revealed_cells
+        for index in revealed_cells[self.revealed_count:]:
+            value = displayed[index]
+            if value == globals.CELL_EXPLORED_SKULL:
+                self.explored_skulls.append(index)
+                continue
+
+            if index < self.skull_finder.col_size:
+                self.reached_top_row = True
+            if index >= bottom_row_start:
+                self.explored_bottom_count += 1
+
+            if value in range(1, 10):
+                self.frontier[index] = value
+
+                # Loop 1: The bottom row in Skull Finder is always safe. Only the cells next to a number matter to the
+                # other loops, so mark those as they appear instead of the whole row
+                for cell in self.neighbors[index]:
+                    if cell >= bottom_row_start:
+                        self.auto_safe[cell] = 1
+
+        self.revealed_count = len(revealed_cells)
+
+    def numbered_cells(self, displayed: DisplayedView):
+        # Numbers whose neighbors are all explored or flagged can no longer tell the solver anything. Drop them
+        resolved = [index for index in self.frontier if all(displayed[cell] != globals.CELL_UNEXPLORED or self.auto_flag[cell] for cell in self.neighbors[index])]
+        for index in resolved:
+            del self.frontier[index]
+
+        return sorted(self.frontier.items())
+
+    def nearest_bottom_cell(self, displayed: DisplayedView):
+        # Every unexplored bottom row cell is a safe destination, but only the one closest to the selected column can
+        # come first once destinations are sorted
+        if self.explored_bottom_count == self.skull_finder.col_size:
+            return None
+
+        bottom_row_start = self.skull_finder.get_index(self.skull_finder.row_size - 1, 0)
+        for distance in range(self.skull_finder.col_size):
+            for col in (self.selected_col - distance, self.selected_col + distance):
+                if self.skull_finder.valid_col(col) and displayed[bottom_row_start + col] == globals.CELL_UNEXPLORED:
+                    return bottom_row_start + col
+
+        return None
+
+    def analyze_board_simple(self, displayed: DisplayedView):
+        numbered = self.numbered_cells(displayed)
+
+        # Loop 1 runs in update_revealed as numbers are revealed
+
+        # Loop 2: Compare cell value with number of unsafe unexplored neighbors
+        # If the number of unexplored unsafe neighbors == the cell value, then flag all unexplored unsafe neighbors
+        for index, value in numbered:
+            neighbors_unexplored_unsafe = [cell for cell in self.neighbors[index] if displayed[cell] == globals.CELL_UNEXPLORED and not self.auto_safe[cell]]
+
+            if len(neighbors_unexplored_unsafe) == value:
+                for neighbor in neighbors_unexplored_unsafe:
+                    self.auto_flag[neighbor] = 1
+
+        # Loop 3: Compare cell value with number of flagged neighbors
+        # If the number of flagged neighbors == the cell value, then mark all non-flagged neighbors as safe.
+        for index, value in numbered:
+            neighbors = self.neighbors[index]
+            neighbors_flagged_count = sum(self.auto_flag[cell] for cell in neighbors)
+
+            if neighbors_flagged_count == value:
+                for neighbor in neighbors:
+                    if not self.auto_flag[neighbor]:
+                        self.auto_safe[neighbor] = 1
+
+        return self.collect_destinations(displayed)
+
+    def analyze_board_complex(self, displayed: DisplayedView):
+        numbered = self.numbered_cells(displayed)
+
+        if self.analysis == "pairwise":
+            self.compare_cardinal_pairs(displayed, numbered)
+        else:
+            # Loop 4: Treat every explored number as a constraint on its unknown neighbors and solve them together.
+            # Covers overlapping pairs in any direction (including diagonals) and multi-cell chains via Gaussian elimination
+            deduce(displayed, numbered, self.neighbors, self.auto_safe, self.auto_flag)
+
+        return self.collect_destinations(displayed)
+
+    def compare_cardinal_pairs(self, displayed: DisplayedView, numbered: list):
+        # Loop 4 (pairwise): Advanced comparison between two cardinal neighbors (no diagonals) with values 1-9.
+        # A number with no unknown neighbors left still proves the rest of its neighbor's cells safe, so numbers
+        # beside the frontier take part too
+        pairs = dict(numbered)
+        for index, _ in numbered:
+            for cell in self.cardinal_neighbors[index]:
+                if displayed[cell] in range(1, 10):
+                    pairs.setdefault(cell, displayed[cell])
+
+        for index_a, value_a in sorted(pairs.items()):
+            neighbors_a = self.neighbors[index_a]
+            neighbors_a_unexplored_non_flagged = {cell for cell in neighbors_a if displayed[cell] == globals.CELL_UNEXPLORED and not self.auto_flag[cell]}
+            modified_value_a = value_a - sum(self.auto_flag[cell] for cell in neighbors_a)
+
+            for index_b in self.cardinal_neighbors[index_a]:
+                value_b = displayed[index_b]
+                if value_b not in range(1, 10):
+                    continue
+
+                neighbors_b = self.neighbors[index_b]
+                neighbors_b_unexplored_non_flagged = {cell for cell in neighbors_b if displayed[cell] == globals.CELL_UNEXPLORED and not self.auto_flag[cell]}
+                modified_value_b = value_b - sum(self.auto_flag[cell] for cell in neighbors_b)
+
+                neighbors_a_unexplored_non_flagged_exclusive = neighbors_a_unexplored_non_flagged - neighbors_b_unexplored_non_flagged
+                neighbors_b_unexplored_non_flagged_exclusive = neighbors_b_unexplored_non_flagged - neighbors_a_unexplored_non_flagged
+
+                if modified_value_a - modified_value_b == len(neighbors_a_unexplored_non_flagged_exclusive):
+                    for cell in neighbors_a_unexplored_non_flagged_exclusive:
+                        self.auto_flag[cell] = 1
+                    for cell in neighbors_b_unexplored_non_flagged_exclusive:
+                        self.auto_safe[cell] = 1
+
+    def collect_destinations(self, displayed: DisplayedView):
+        # Final loop: Add all unexplored safe cells to the destinations list.
+        # Apart from the bottom row, every safe cell was marked from a number still on the frontier
+        destinations = set()
+        for index in self.frontier:
+            for cell in self.neighbors[index]:
+                if displayed[cell] == globals.CELL_UNEXPLORED and self.auto_safe[cell]:
+                    if self.auto_flag[cell]:
+                        row, col = divmod(cell, self.skull_finder.col_size)
+                        raise Exception(f"Cell {row}, {col} is marked as both flagged and safe")
+
+                    destinations.add(cell)
+
+        nearest_bottom_cell = self.nearest_bottom_cell(displayed)
+        if nearest_bottom_cell is not None:
+            destinations.add(nearest_bottom_cell)
+
+        return sorted(destinations)
+
+    def priority(self, destination: int):
+        row, col = divmod(destination, self.skull_finder.col_size)
+        distance = abs(self.selected_row - row) + abs(self.selected_col - col)
+        if self.order == "nearest":
+            return distance
+
+        # Distance from the selected cell + distance from the goal row
+        heuristic = row
+        return heuristic + distance
+
+    def sort_destinations(self):
+        return sorted(self.destinations, key=self.priority)
+
+    def pick_guess(self, displayed: DisplayedView):
+        # No reachable cell is proven safe. Guess the reachable cell least likely to hold a skull
+        # Only frontier numbers and explored skulls can still have unexplored cardinal neighbors
+        candidates = set()
+        for index in list(self.frontier) + self.explored_skulls:
+            for cell in self.cardinal_neighbors[index]:
+                if displayed[cell] == globals.CELL_UNEXPLORED and not self.auto_flag[cell]:
+                    candidates.add(cell)
+
+        if not candidates:
+            return None
+
+        # Cells away from the frontier share the density of the skulls left unaccounted for
+        bottom_row_start = self.skull_finder.get_index(self.skull_finder.row_size - 1, 0)
+        unexplored_safe_count = self.skull_finder.col_size - self.explored_bottom_count
+        unexplored_safe_count += sum(1 for cell in self.collect_destinations(displayed) if cell < bottom_row_start)
+        flag_count = self.auto_flag.marked_count()
+        unknown_count = len(displayed) - self.revealed_count - unexplored_safe_count - flag_count
+        remaining = self.skull_finder.skull_count - flag_count - len(self.explored_skulls)
+        density = max(remaining, 0) / unknown_count if unknown_count > 0 else 0.0
+
+        densities = frontier_densities(displayed, self.numbered_cells(displayed), self.neighbors, self.auto_safe, self.auto_flag)
+        guess = min(sorted(candidates), key=lambda cell: (densities.get(cell, density), self.priority(cell)))
+        return divmod(guess, self.skull_finder.col_size)
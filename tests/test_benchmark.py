@@ -0,0 +1,109 @@
+import unittest
+
+from benchmark import check_baseline, check_thresholds, percentile, wilson_interval
+
+
+def make_metrics(won_seeds: list, games: int = 10, p99_ms: float = 1.0):
+    low, high = wilson_interval(len(won_seeds), games)
+    return {
+        "win_rate": len(won_seeds) / games,
+        "win_rate_low": low,
+        "win_rate_high": high,
+        "mean_ms": p99_ms / 2,
+        "p99_ms": p99_ms,
+        "mean_moves": 9.0,
+        "won_seeds": won_seeds,
+    }
+
+
+class TestWilsonInterval(unittest.TestCase):
+    def test_no_games(self):
+        self.assertEqual(wilson_interval(0, 0), (0.0, 0.0))
+
+    def test_known_value(self):
+        # 90 wins in 100 games
+        low, high = wilson_interval(90, 100)
+        self.assertAlmostEqual(low, 0.8256, places=4)
+        self.assertAlmostEqual(high, 0.9448, places=4)
+
+    def test_bounds_at_extremes(self):
+        # Unlike the normal approximation, the interval never collapses to a point or leaves 0-1
+        low, high = wilson_interval(0, 100)
+        self.assertAlmostEqual(low, 0.0)
+        self.assertGreater(high, 0.0)
+
+        low, high = wilson_interval(100, 100)
+        self.assertLess(low, 1.0)
+        self.assertAlmostEqual(high, 1.0)
+
+    def test_narrows_with_more_games(self):
+        low_small, high_small = wilson_interval(9, 10)
+        low_large, high_large = wilson_interval(900, 1000)
+        self.assertLess(high_large - low_large, high_small - low_small)
+
+
+class TestPercentile(unittest.TestCase):
+    def test_empty(self):
+        self.assertEqual(percentile([], 99), 0.0)
+
+    def test_single_value(self):
+        self.assertEqual(percentile([0.5], 99), 0.5)
+
+    def test_inclusive(self):
+        values = list(range(101))
+        self.assertAlmostEqual(percentile(values, 50), 50)
+        self.assertAlmostEqual(percentile(values, 99), 99)
+
+    def test_order_does_not_matter(self):
+        self.assertAlmostEqual(percentile([3, 1, 2, 5, 4], 99), percentile([1, 2, 3, 4, 5], 99))
+
+
+class TestCheckThresholds(unittest.TestCase):
+    def test_no_thresholds(self):
+        self.assertEqual(check_thresholds({"deduction": make_metrics([])}), [])
+
+    def test_win_rate_uses_lower_bound(self):
+        # 9 wins in 10 games is a 90% win rate, but the lower bound of its interval is far below that
+        report = {"deduction": make_metrics(list(range(9)))}
+        self.assertEqual(len(check_thresholds(report, min_win_rate=0.9)), 1)
+        self.assertEqual(check_thresholds(report, min_win_rate=0.5), [])
+
+    def test_p99(self):
+        report = {"fast": make_metrics([], p99_ms=1.0), "slow": make_metrics([], p99_ms=6.0)}
+        failures = check_thresholds(report, max_p99_ms=5.0)
+        self.assertEqual(len(failures), 1)
+        self.assertTrue(failures[0].startswith("slow:"))
+
+
+class TestCheckBaseline(unittest.TestCase):
+    def test_same_outcomes_pass(self):
+        metrics = make_metrics([0, 1, 2])
+        self.assertEqual(check_baseline({"deduction": metrics}, {"deduction": metrics}, 0.25), [])
+
+    def test_net_loss_fails(self):
+        # One board lost and none gained, even though the win rate intervals overlap
+        report = {"deduction": make_metrics([0, 1, 2, 3, 4, 5, 6, 7])}
+        baseline = {"deduction": make_metrics([0, 1, 2, 3, 4, 5, 6, 7, 8])}
+        failures = check_baseline(report, baseline, 0.25)
+        self.assertEqual(len(failures), 1)
+        self.assertIn("net loss of 1", failures[0])
+
+    def test_swapped_boards_pass(self):
+        # Losing one board and winning another leaves the total unchanged
+        report = {"deduction": make_metrics([0, 1, 3])}
+        baseline = {"deduction": make_metrics([0, 1, 2])}
+        self.assertEqual(check_baseline(report, baseline, 0.25), [])
+
+    def test_latency_tolerance(self):
+        baseline = {"deduction": make_metrics([], p99_ms=1.0)}
+        self.assertEqual(check_baseline({"deduction": make_metrics([], p99_ms=1.2)}, baseline, 0.25), [])
+        self.assertEqual(len(check_baseline({"deduction": make_metrics([], p99_ms=1.3)}, baseline, 0.25)), 1)
+
+    def test_new_strategy_skipped(self):
+        report = {"deduction-guess": make_metrics([])}
+        baseline = {"deduction": make_metrics([0, 1, 2])}
+        self.assertEqual(check_baseline(report, baseline, 0.25), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
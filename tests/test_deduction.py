@@ -0,0 +1,79 @@
+import unittest
+
+import globals
+from deduction import deduce, eliminate, reduce_subsets, solve_component
+from skull_finder import NeighborLookup
+
+# Single-bit masks for cells a, b, c, d
+A = 0b0001
+B = 0b0010
+C = 0b0100
+D = 0b1000
+
+
+class TestReduceSubsets(unittest.TestCase):
+    def test_subset(self):
+        # a + b = 1 and a + b + c = 1, so c is safe
+        safe, skull = reduce_subsets({A | B: 1, A | B | C: 1})
+        self.assertEqual(safe, C)
+        self.assertEqual(skull, 0)
+
+    def test_reverse_pair(self):
+        # b + c + d = 2 has one more skull than a + b + c = 1 and only d outside the pair,
+        # so d is a skull and a is safe. Checked in both insertion orders
+        for constraints in ({A | B | C: 1, B | C | D: 2}, {B | C | D: 2, A | B | C: 1}):
+            safe, skull = reduce_subsets(constraints)
+            self.assertEqual(safe, A)
+            self.assertEqual(skull, D)
+
+    def test_does_not_modify_constraints(self):
+        constraints = {A | B: 1, A | B | C | D: 2}
+        reduce_subsets(constraints)
+        self.assertEqual(constraints, {A | B: 1, A | B | C | D: 2})
+
+
+class TestEliminate(unittest.TestCase):
+    def test_system_without_subsets(self):
+        # a + b = 1, b + c = 1, a + c = 2 only solves as a system
+        safe, skull = eliminate({A | B: 1, B | C: 1, A | C: 2})
+        self.assertEqual(safe, B)
+        self.assertEqual(skull, A | C)
+
+    def test_undetermined(self):
+        self.assertEqual(eliminate({A | B: 1}), (0, 0))
+
+
+class TestSolveComponent(unittest.TestCase):
+    def test_chain(self):
+        # a + b = 1, a + b + c = 2, b + c = 1: c is a skull, then b is safe and a is a skull
+        safe, skull = solve_component({A | B: 1, A | B | C: 2, B | C: 1}, 3)
+        self.assertEqual(safe, B)
+        self.assertEqual(skull, A | C)
+
+
+class TestDeduce(unittest.TestCase):
+    def test_one_two_one(self):
+        # Top row unexplored, bottom row shows 1 2 1: the outer cells are skulls and the middle is safe
+        displayed = [globals.CELL_UNEXPLORED] * 3 + [1, 2, 1]
+        numbered = [(3, 1), (4, 2), (5, 1)]
+        auto_safe = bytearray(6)
+        auto_flag = bytearray(6)
+
+        deduce(displayed, numbered, NeighborLookup(2, 3), auto_safe, auto_flag)
+
+        self.assertEqual(list(auto_flag[:3]), [1, 0, 1])
+        self.assertEqual(list(auto_safe[:3]), [0, 1, 0])
+
+    def test_flagged_neighbors_reduce_count(self):
+        # The left cell is already flagged, so the 1 under the middle is satisfied and the right cell is safe
+        displayed = [globals.CELL_UNEXPLORED] * 3 + [globals.CELL_EXPLORED_BLANK, 1, globals.CELL_EXPLORED_BLANK]
+        auto_safe = bytearray(6)
+        auto_flag = bytearray([1, 0, 0, 0, 0, 0])
+
+        deduce(displayed, [(4, 1)], NeighborLookup(2, 3), auto_safe, auto_flag)
+
+        self.assertEqual(list(auto_safe[:3]), [0, 1, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
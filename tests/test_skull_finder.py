@@ -0,0 +1,169 @@
+import random
+import unittest
+
+import globals
+from skull_finder import SkullFinder, SparseSkullFinder
+from solver import Solver
+
+SEEDS = range(50)
+
+
+def make_board(board_class: type, seed: int, row_size: int = 7, col_size: int = 7, skull_count: int = None):
+    random.seed(seed)
+    skull_finder = board_class(row_size=row_size, col_size=col_size, skull_count=skull_count)
+    skull_finder.fill_grid()
+    return skull_finder
+
+
+def recursive_reveal(skull_finder: SkullFinder, row: int, col: int, revealed: dict):
+    # The original recursive flood fill, kept as a reference. Records (row, col) -> displayed value
+    if (row, col) in revealed:
+        return
+
+    if skull_finder.is_skull(row, col):
+        revealed[(row, col)] = globals.CELL_EXPLORED_SKULL
+        return
+
+    revealed[(row, col)] = skull_finder.sum_neighboring_skulls(row, col)
+    if revealed[(row, col)] == globals.CELL_EXPLORED_BLANK:
+        for x in range(-1, 2):
+            if not skull_finder.valid_row(row + x):
+                continue
+
+            for y in range(-1, 2):
+                if not skull_finder.valid_col(col + y):
+                    continue
+
+                recursive_reveal(skull_finder, row + x, col + y, revealed)
+
+
+def displayed_cells(skull_finder: SkullFinder):
+    displayed = {}
+    for row in range(skull_finder.row_size):
+        for col in range(skull_finder.col_size):
+            value = skull_finder.get_displayed(row, col)
+            if value != globals.CELL_UNEXPLORED:
+                displayed[(row, col)] = value
+
+    return displayed
+
+
+def play(skull_finder: SkullFinder, solver: Solver):
+    # Returns every move the solver made
+    selected_row = skull_finder.row_size
+    selected_col = 0
+    moves = []
+    while skull_finder.status == globals.PLAYING:
+        next_move = solver.next_move(selected_row, selected_col)
+        if next_move is None:
+            break
+
+        selected_row, selected_col = next_move
+        skull_finder.explore_cell(selected_row, selected_col)
+        moves.append(next_move)
+
+    return moves
+
+
+class TestExploreCell(unittest.TestCase):
+    def test_flood_matches_recursive(self):
+        # Low density boards open large blank regions from the bottom row
+        for board_class in (SkullFinder, SparseSkullFinder):
+            for seed in SEEDS:
+                skull_finder = make_board(board_class, seed, row_size=12, col_size=12, skull_count=8)
+                col = seed % skull_finder.col_size
+                revealed = {}
+                recursive_reveal(skull_finder, skull_finder.row_size - 1, col, revealed)
+
+                skull_finder.explore_cell(skull_finder.row_size - 1, col)
+                self.assertEqual(displayed_cells(skull_finder), revealed, f"{board_class.__name__} seed {seed}")
+
+    def test_explored_cell_is_unchanged(self):
+        skull_finder = make_board(SkullFinder, 0)
+        skull_finder.explore_cell(skull_finder.row_size - 1, 0)
+        displayed = displayed_cells(skull_finder)
+        revealed_count = len(skull_finder.revealed_cells)
+
+        skull_finder.explore_cell(skull_finder.row_size - 1, 0)
+        self.assertEqual(displayed_cells(skull_finder), displayed)
+        self.assertEqual(len(skull_finder.revealed_cells), revealed_count)
+
+
+class TestSparseSkullFinder(unittest.TestCase):
+    def test_same_board_as_dense(self):
+        for seed in SEEDS:
+            dense = make_board(SkullFinder, seed)
+            sparse = make_board(SparseSkullFinder, seed)
+            for row in range(dense.row_size):
+                for col in range(dense.col_size):
+                    self.assertEqual(bool(dense.is_skull(row, col)), bool(sparse.is_skull(row, col)))
+                    self.assertEqual(dense.sum_neighboring_skulls(row, col), sparse.sum_neighboring_skulls(row, col))
+
+    def test_same_games_as_dense(self):
+        for strategy in ({"analysis": "pairwise"}, {"analysis": "deduction", "guess": True}):
+            for seed in SEEDS:
+                dense = make_board(SkullFinder, seed)
+                sparse = make_board(SparseSkullFinder, seed)
+                dense_moves = play(dense, Solver(dense, **strategy))
+                sparse_moves = play(sparse, Solver(sparse, **strategy))
+
+                self.assertEqual(dense_moves, sparse_moves, f"{strategy} seed {seed}")
+                self.assertEqual(dense.status, sparse.status)
+                self.assertEqual(displayed_cells(dense), displayed_cells(sparse))
+
+    def test_reveal_all_shows_skulls(self):
+        skull_finder = make_board(SparseSkullFinder, 0, row_size=100, col_size=100, skull_count=20)
+        skull_finder.reveal_all()
+        skulls = {cell for cell, value in displayed_cells(skull_finder).items() if value == globals.CELL_EXPLORED_SKULL}
+        self.assertEqual(len(skulls), 20)
+        self.assertTrue(all(skull_finder.is_skull(row, col) for row, col in skulls))
+
+
+class TestRevealedCells(unittest.TestCase):
+    def test_matches_displayed_grid(self):
+        for board_class in (SkullFinder, SparseSkullFinder):
+            for seed in SEEDS:
+                skull_finder = make_board(board_class, seed)
+                play(skull_finder, Solver(skull_finder, guess=True))
+
+                revealed = [divmod(index, skull_finder.col_size) for index in skull_finder.revealed_cells]
+                self.assertEqual(len(revealed), len(set(revealed)), "a cell was recorded twice")
+                self.assertEqual(set(revealed), set(displayed_cells(skull_finder)))
+
+    def test_solver_state_follows_revealed_cells(self):
+        for seed in SEEDS:
+            skull_finder = make_board(SkullFinder, seed)
+            solver = Solver(skull_finder, guess=True)
+            selected_row = skull_finder.row_size
+            selected_col = 0
+            while skull_finder.status == globals.PLAYING:
+                next_move = solver.next_move(selected_row, selected_col)
+                self.assert_solver_state(skull_finder, solver)
+                if next_move is None:
+                    break
+
+                selected_row, selected_col = next_move
+                skull_finder.explore_cell(selected_row, selected_col)
+
+    def assert_solver_state(self, skull_finder: SkullFinder, solver: Solver):
+        displayed = skull_finder.flat_displayed_data()
+        bottom_row_start = skull_finder.get_index(skull_finder.row_size - 1, 0)
+        explored = [index for index in range(len(displayed)) if displayed[index] != globals.CELL_UNEXPLORED]
+
+        self.assertEqual(solver.revealed_count, len(skull_finder.revealed_cells))
+        self.assertEqual(solver.explored_skulls, [index for index in skull_finder.revealed_cells if displayed[index] == globals.CELL_EXPLORED_SKULL])
+        self.assertEqual(solver.explored_bottom_count, sum(1 for index in explored if index >= bottom_row_start))
+        self.assertEqual(solver.reached_top_row, any(index < skull_finder.col_size for index in explored))
+
+        # Every number with an unexplored, unflagged neighbor is on the frontier
+        for index in explored:
+            if displayed[index] in range(1, 10):
+                open_neighbors = [cell for cell in solver.neighbors[index] if displayed[cell] == globals.CELL_UNEXPLORED and not solver.auto_flag[cell]]
+                if open_neighbors:
+                    self.assertEqual(solver.frontier.get(index), displayed[index])
+            else:
+                self.assertNotIn(index, solver.frontier)
+
+
+if __name__ == "__main__":
+    unittest.main()
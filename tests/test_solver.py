@@ -0,0 +1,72 @@
+import unittest
+
+import globals
+from skull_finder import SkullFinder
+from solver import Solver
+
+# Seeded 7x7 board 1712. X marks a skull
+STALL_SKULLS = (
+    ".......",
+    "....X.X",
+    "..X....",
+    ".X...X.",
+    "X......",
+    "....X..",
+    ".......",
+)
+
+# Explored cells when the solver stalled, with the selected cell at row 5, col 6. O marks an explored cell
+STALL_EXPLORED = (
+    ".......",
+    ".......",
+    "...OOOO",
+    "..OOO.O",
+    ".OOOOOO",
+    "OOOO.OO",
+    "OOOOOOO",
+)
+
+
+def make_board(skulls: tuple, explored: tuple):
+    skull_finder = SkullFinder(row_size=len(skulls), col_size=len(skulls[0]))
+    for row, line in enumerate(skulls):
+        for col, cell in enumerate(line):
+            if cell == "X":
+                skull_finder.place_skull(row, col)
+
+    for row, line in enumerate(explored):
+        for col, cell in enumerate(line):
+            if cell == "O":
+                skull_finder.explore_cell(row, col)
+
+    return skull_finder
+
+
+class TestNextMove(unittest.TestCase):
+    def test_unreachable_safe_cell_runs_deduction(self):
+        # The simple loops prove row 2, col 1 safe, but it is only reachable diagonally.
+        # Deduction still has to run and find row 1, col 5, which is reachable from row 2, col 5
+        for analysis in ("deduction", "pairwise"):
+            skull_finder = make_board(STALL_SKULLS, STALL_EXPLORED)
+            solver = Solver(skull_finder, analysis=analysis)
+            next_move = solver.next_move(5, 6)
+            self.assertIsNotNone(next_move)
+            self.assertFalse(skull_finder.is_skull(*next_move))
+            self.assertTrue(solver.is_reachable(skull_finder.get_index(*next_move), skull_finder.flat_displayed_data()))
+
+    def test_guess_waits_for_deduction(self):
+        # A provably safe reachable cell exists, so the guessing strategy must not guess
+        skull_finder = make_board(STALL_SKULLS, STALL_EXPLORED)
+        solver = Solver(skull_finder, analysis="deduction", guess=True)
+        solver.pick_guess = lambda displayed: self.fail("guessed while a safe cell was reachable")
+        self.assertEqual(solver.next_move(5, 6), (1, 5))
+
+    def test_simple_analysis_stalls(self):
+        # Without complex analysis there is no reachable safe cell
+        skull_finder = make_board(STALL_SKULLS, STALL_EXPLORED)
+        self.assertIsNone(Solver(skull_finder, analysis="simple").next_move(5, 6))
+        self.assertEqual(skull_finder.status, globals.PLAYING)
+
+
+if __name__ == "__main__":
+    unittest.main()